@@ -0,0 +1,59 @@
+"""
+Compare bulk start/stop on many marked stopwatches with start/stop on a single one.
+
+Runs the app headless, so it needs only the package dependencies:
+
+    python benchmarks/bulk_operations.py [number of stopwatches]
+"""
+
+import asyncio
+import gc
+import json
+import os
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+
+from chronotui.app import StopwatchApp
+
+ROUNDS = 5
+
+
+def timed(action) -> float:
+    gc.collect()
+    start = perf_counter()
+    action()
+    return perf_counter() - start
+
+
+async def run(count: int) -> None:
+    data_dir = tempfile.mkdtemp()
+    StopwatchApp.SAVE_PATH = StopwatchApp.CONFIG_PATH = data_dir
+    StopwatchApp.SAVE_FILE = os.path.join(data_dir, "session.json")
+    StopwatchApp.CONFIG_FILE = os.path.join(data_dir, "config.json")
+    with open(StopwatchApp.SAVE_FILE, "w") as f:
+        json.dump({"stopwatches": [{"name": f"Stopwatch {i + 1}"} for i in range(count)]}, f)
+    with open(StopwatchApp.CONFIG_FILE, "w") as f:
+        json.dump({"confirmation_screens": False}, f)
+
+    app = StopwatchApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        single, bulk = [], []
+        for _ in range(ROUNDS):
+            app.action_clear_marks()
+            single.append(timed(app.action_toggle_selected) + timed(app.action_toggle_selected))
+            for sw in app.stopwatches():
+                sw.add_class("marked")
+            bulk.append(timed(app.action_toggle_selected) + timed(app.action_toggle_selected))
+            await pilot.pause()
+
+    single_time, bulk_time = statistics.median(single), statistics.median(bulk)
+    print(f"start + stop, 1 stopwatch:         {single_time * 1000:8.1f} ms")
+    print(f"start + stop, {count} marked stopwatches: {bulk_time * 1000:8.1f} ms (includes the session save)")
+    print(f"ratio: {bulk_time / single_time:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -3,18 +3,20 @@ import json
 import logging
 import os
 import sys
+from typing import Optional
 
 import platformdirs
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Center, VerticalScroll
+from textual.containers import VerticalScroll
 from textual.css.query import NoMatches
-from textual.screen import ModalScreen
-from textual.widgets import Footer, Header, Input, HelpPanel
+from textual.widgets import Footer, Header, HelpPanel
 
 from chronotui.config.defaults import ALLOWED_THEMES, DEFAULT_CONFIG
+from chronotui.config.logging_setup import setup_logging
 from chronotui.widgets.confirm_screen import ConfirmScreen
+from chronotui.widgets.input_screen import InputScreen
 from chronotui.widgets.settings_screen import SettingsScreen
 from chronotui.widgets.stopwatch import Stopwatch
 
@@ -23,14 +25,16 @@ file_logging = "-l" in sys.argv or "--log" in sys.argv
 
 
 def main():
-    logging.basicConfig(
-        level=logging.INFO if file_logging else logging.ERROR,
-        filename="chronotui.log" if file_logging else None,
-    )
+    stop_logging = setup_logging(file_logging)
     app = StopwatchApp()
     app.title = "ChronoTUI"
     app.sub_title = "Track your time with style"
-    app.run()
+    try:
+        app.run()
+    finally:
+        # Report pending rate limited counts and flush the queue to the log file
+        if stop_logging is not None:
+            stop_logging()
 
 
 class StopwatchApp(App):
@@ -45,6 +49,8 @@ class StopwatchApp(App):
         ("a", "add_stopwatch", "Add timer"),
         ("d", "delete_stopwatch", "Delete timer"),
         ("n", "change_name", "reName timer"),
+        ("m", "toggle_mark", "Mark"),
+        ("g", "move_to_group", "Group"),
         ("t", "configure_theme", "Theme"),
         ("s", "configure_settings", "Settings"),
         Binding("?", "toggle_help_panel", "Keybindings", show=True),
@@ -52,6 +58,9 @@ class StopwatchApp(App):
         Binding("down", "select_down", "Down", show=False),
         Binding("j", "select_down", "Down", show=False),
         Binding("k", "select_up", "Up", show=False),
+        Binding("V", "mark_range", "Mark range", show=False),
+        Binding("/", "mark_search", "Mark by search", show=False),
+        Binding("escape", "clear_marks", "Clear marks", show=False),
         Binding("S", "save_stopwatches", "Save Stopwatches", show=False),
         Binding("L", "load_stopwatches", "Load Stopwatches", show=False),
         # duplicate of reName, keep until another usecase for `c` appears
@@ -79,12 +88,12 @@ class StopwatchApp(App):
                 with open(self.CONFIG_FILE, "r") as f:
                     loaded = json.load(f)
                 config.update(loaded)
-                logger.info(f"Config loaded from {self.CONFIG_FILE}")
+                logger.info("Config loaded from %s", self.CONFIG_FILE)
             except Exception as e:
-                logger.error(f"Failed to load config: {e}")
+                logger.error("Failed to load config: %s", e)
         else:
             logger.info("No config file found, using defaults.")
-        logger.debug(f"Loaded configuration: {config}")
+        logger.debug("Loaded configuration: %s", config)
         self.config = config
 
     def process_config(self) -> None:
@@ -112,22 +121,25 @@ class StopwatchApp(App):
         if not isinstance(self.config["confirmation_screens"], bool):
             raise ValueError("confirmation_screens must be a boolean.")
 
-        logger.info(f"Processed config: {self.config}")
+        logger.info("Processed config: %s", self.config)
 
     def save_config(self):
         """Save current configuration to CONFIG_FILE."""
         try:
             with open(self.CONFIG_FILE, "w") as f:
                 json.dump(self.config, f, indent=2, ensure_ascii=False)
-            logger.info(f"Config saved to {self.CONFIG_FILE}")
+            logger.info("Config saved to %s", self.CONFIG_FILE)
         except Exception as e:
-            logger.error(f"Failed to save config: {e}")
+            logger.error("Failed to save config: %s", e)
 
     async def on_mount(self) -> None:
         os.makedirs(self.SAVE_PATH, exist_ok=True)
         os.makedirs(self.CONFIG_PATH, exist_ok=True)
         self.load_config()
         self.process_config()
+        # Stopwatches with class changes whose styles are not applied yet, because they are off-screen
+        self.stale_stopwatches = set()
+        self.watch(self.query_one("#timers"), "scroll_y", self.restyle_visible_stopwatches, init=False)
         # Autoload state on app start
         await self.action_load_stopwatches()
 
@@ -139,7 +151,7 @@ class StopwatchApp(App):
             stopwatches = data["stopwatches"] if isinstance(data, dict) and "stopwatches" in data else data
             last_modified = data.get("last_modified") if isinstance(data, dict) else None
         except Exception as e:
-            logger.error(f"Failed to load stopwatches: {e}")
+            logger.error("Failed to load stopwatches: %s", e)
             return
 
         # Calculate time delta if clocks were running
@@ -148,7 +160,7 @@ class StopwatchApp(App):
             try:
                 saved_time = datetime.datetime.fromisoformat(last_modified)
             except Exception as e:
-                logger.warning(f"Could not parse last_modified: {e}")
+                logger.warning("Could not parse last_modified: %s", e)
                 saved_time = None
             if saved_time:
                 now = datetime.datetime.now(saved_time.tzinfo) if saved_time.tzinfo else datetime.datetime.now()
@@ -156,6 +168,7 @@ class StopwatchApp(App):
 
         # Remove all existing stopwatches, and wait until they really are removed
         await self.query("Stopwatch").remove()
+        self.stale_stopwatches.clear()
 
         new_stopwatches = []
         selected_stopwatch = None
@@ -164,39 +177,41 @@ class StopwatchApp(App):
             sw_time = sw_data.get("time", 0)
             running = sw_data.get("running", False)
             active = sw_data.get("active", False)
+            group = sw_data.get("group")
             # If running, add time delta
             if running and time_delta > 0:
                 sw_time += time_delta
-            sw = Stopwatch(name, time=sw_time, running=running, active=active)
+            sw = Stopwatch(name, time=sw_time, running=running, active=active, group=group)
             self.query_one("#timers").mount(sw)
-            logger.info(f"Loading stopwatch: {name}")
+            logger.info("Loading stopwatch: %s", name)
             new_stopwatches.append(sw)
             if active:
                 selected_stopwatch = sw
         self.selected_stopwatch = (
             selected_stopwatch if selected_stopwatch else (new_stopwatches[0] if new_stopwatches else None)
         )
-        logger.info(f"Selected stopwatch: {self.selected_stopwatch.sw_name if self.selected_stopwatch else 'None'}")
-        logger.info(f"Stopwatches loaded from {self.SAVE_FILE}")
+        logger.info("Selected stopwatch: %s", self.selected_stopwatch.sw_name if self.selected_stopwatch else "None")
+        logger.info("Stopwatches loaded from %s", self.SAVE_FILE)
 
     def action_save_stopwatches(self) -> None:
         stopwatches = []
-        for sw in self.query("Stopwatch"):
+        for sw in self.stopwatches():
             # Try to get the time from the TimeDisplay widget
             try:
-                time_display = sw.query_one("TimeDisplay")
+                time_display = sw.time_display
                 time_value = getattr(time_display, "time", None)
-                logger.info(f"Getting time for stopwatch: {sw.sw_name}, {time_value}")
+                logger.info("Getting time for stopwatch: %s, %s", sw.sw_name, time_value)
                 if time_value is None and hasattr(time_display, "get_time"):
                     time_value = time_display.get_time()
             except Exception:
-                logger.warning(f"Failed to get time for stopwatch {sw.sw_name}")
+                logger.warning("Failed to get time for stopwatch %s", sw.sw_name)
                 time_value = None
             sw_data = {
                 "name": getattr(sw, "sw_name", None),
                 "time": time_value,
-                "running": "started" in sw.classes,
-                "active": "selected" in sw.classes,
+                "running": sw.running,
+                "active": sw.has_class("selected"),
+                "group": sw.group,
             }
             stopwatches.append(sw_data)
 
@@ -207,67 +222,232 @@ class StopwatchApp(App):
 
         try:
             with open(self.SAVE_FILE, "w") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            logger.info(f"Stopwatches saved to {self.SAVE_FILE}")
+                # Encode in one go: json.dump writes chunk by chunk through the pure Python encoder
+                f.write(json.dumps(result, indent=2, ensure_ascii=False))
+            logger.info("Stopwatches saved to %s", self.SAVE_FILE)
         except Exception as e:
-            logger.error(f"Failed to save stopwatches: {e}")
+            logger.error("Failed to save stopwatches: %s", e)
 
     @work
     async def action_change_name(self) -> None:
         if not hasattr(self, "selected_stopwatch") or self.selected_stopwatch is None:
             return
-        logger.info(f"Name change requested for stopwatch: {self.selected_stopwatch.sw_name}")
+        logger.info("Name change requested for stopwatch: %s", self.selected_stopwatch.sw_name)
 
-        class NameInputScreen(ModalScreen[str]):
-            def compose(self) -> ComposeResult:
-                yield Center(
-                    Input(value=self.app.selected_stopwatch.sw_name, placeholder="Enter new name", id="name-input")
-                )
-
-            def on_input_submitted(self, event: Input.Submitted) -> None:
-                new_name = self.query_one(Input).value
-                self.dismiss(new_name)
-
-        new_name = await self.push_screen_wait(NameInputScreen())
-        logger.info(f"Proposed name: {new_name}")
+        new_name = await self.push_screen_wait(
+            InputScreen(value=self.selected_stopwatch.sw_name, placeholder="Enter new name")
+        )
+        logger.info("Proposed name: %s", new_name)
 
         if new_name is not None and new_name.strip():
             self.selected_stopwatch.set_name(new_name)
-            logger.info(f"Stopwatch renamed to: {new_name}")
+            logger.info("Stopwatch renamed to: %s", new_name)
+
+    def stopwatches(self, with_class: Optional[str] = None) -> list[Stopwatch]:
+        """Stopwatches in #timers, optionally only those with the given class.
+
+        Checks the children of #timers directly, which is much cheaper than a query matching a CSS selector
+        against every widget inside every stopwatch.
+        """
+        return [
+            sw
+            for sw in self.query_one("#timers").children
+            if isinstance(sw, Stopwatch) and (with_class is None or sw.has_class(with_class))
+        ]
+
+    def target_stopwatches(self) -> list[Stopwatch]:
+        """Stopwatches affected by an action: the marked ones if any, otherwise the selected one."""
+        marked = self.stopwatches("marked")
+        if marked:
+            return marked
+        if getattr(self, "selected_stopwatch", None) is not None:
+            return [self.selected_stopwatch]
+        return []
+
+    def restyle_stopwatches(self, stopwatches, children: bool = True) -> None:
+        """Apply class changes made with `update=False`.
+
+        Stopwatches in view are restyled right away, in a single stylesheet pass. The others are only
+        remembered in `stale_stopwatches`, and get restyled by `restyle_visible_stopwatches` once in view.
+        That is not automatic: every path which can bring stopwatches into view (scrolling, resizing,
+        deleting, moving to a group) calls it, and any new action which moves stopwatches has to as well.
+        With `children=False` only the Stopwatch nodes are restyled, for classes no child rule depends on
+        (see the `.marked` rule in stopwatch.tcss).
+        """
+        window = self.query_one("#timers").window_region
+        nodes = []
+        for sw in stopwatches:
+            region = sw.virtual_region
+            # An empty region means the stopwatch is not laid out yet, so it can't be told apart as off-screen
+            if region and not window.overlaps(region):
+                self.stale_stopwatches.add(sw)
+            elif children:
+                nodes.extend(sw.walk_children(with_self=True))
+            else:
+                nodes.append(sw)
+        self.stylesheet.update_nodes(nodes, animate=True)
+
+    def on_resize(self) -> None:
+        if hasattr(self, "stale_stopwatches"):
+            self.call_after_refresh(self.restyle_visible_stopwatches)
+
+    def restyle_visible_stopwatches(self, *_) -> None:
+        """Restyle the stale stopwatches which are now in view."""
+        if not self.stale_stopwatches:
+            return
+        window = self.query_one("#timers").window_region
+        visible = [
+            sw for sw in self.stale_stopwatches if not sw.is_attached or window.overlaps(sw.virtual_region)
+        ]
+        self.stale_stopwatches.difference_update(visible)
+        nodes = [node for sw in visible if sw.is_attached for node in sw.walk_children(with_self=True)]
+        self.stylesheet.update_nodes(nodes, animate=True)
+
+    def save_after_bulk(self, targets: list[Stopwatch]) -> None:
+        """Bulk operations persist the session once, after the whole batch is applied."""
+        if len(targets) > 1:
+            self.action_save_stopwatches()
 
     @work
     async def action_reset_selected(self) -> None:
-        if not hasattr(self, "selected_stopwatch") or self.selected_stopwatch is None:
+        targets = self.target_stopwatches()
+        if not targets:
             return
-        sw = self.selected_stopwatch
         # Confirmation logic
         if self.config.get("confirmation_screens", True):
             confirmed = await self.push_screen_wait(
-                ConfirmScreen(stopwatch_name=getattr(sw, "sw_name", "Stopwatch"), action_name="reset", confirm_key="r")
+                ConfirmScreen(
+                    stopwatch_name=getattr(targets[0], "sw_name", "Stopwatch"),
+                    action_name="reset",
+                    confirm_key="r",
+                    count=len(targets),
+                )
             )
             if not confirmed:
                 logger.info("Reset cancelled by user.")
                 return
-        time_display = sw.query_one("TimeDisplay")
-        time_display.reset()
-        sw.remove_class("started")
-        logger.info(f"Stopwatch reset: {sw.sw_name}")
+        with self.batch_update():
+            for sw in targets:
+                sw.reset_timer(update=False)
+            self.restyle_stopwatches(targets)
+        if len(targets) == 1:
+            logger.info("Stopwatch reset: %s", targets[0].sw_name)
+        else:
+            logger.info("%s stopwatches reset.", len(targets))
+        self.save_after_bulk(targets)
 
     def action_toggle_selected(self) -> None:
-        if not hasattr(self, "selected_stopwatch") or self.selected_stopwatch is None:
+        targets = self.target_stopwatches()
+        if not targets:
             return
-        sw = self.selected_stopwatch
-        time_display = sw.query_one("TimeDisplay")
-        if "started" in sw.classes:
-            time_display.stop()
-            sw.remove_class("started")
-            logger.info(f"Stopwatch stopped: {sw.sw_name}")
+        # With a mixed selection, start the stopped ones; only stop when everything is already running
+        if all(sw.running for sw in targets):
+            with self.batch_update():
+                for sw in targets:
+                    sw.stop_timer(update=False)
+                self.restyle_stopwatches(targets)
+            action = "stopped"
         else:
-            if self.config.get("stop_all_on_start", False):
-                self.action_stop_all_stopwatches()
-            time_display.start()
-            sw.add_class("started")
-            logger.info(f"Stopwatch started: {sw.sw_name}")
+            with self.batch_update():
+                if self.config.get("stop_all_on_start", False):
+                    self.action_stop_all_stopwatches()
+                for sw in targets:
+                    if not sw.running:
+                        sw.start_timer(update=False)
+                self.restyle_stopwatches(targets)
+            action = "started"
+        if len(targets) == 1:
+            logger.info("Stopwatch %s: %s", action, targets[0].sw_name)
+        else:
+            logger.info("%s stopwatches %s.", len(targets), action)
+        self.save_after_bulk(targets)
+
+    def action_toggle_mark(self) -> None:
+        if getattr(self, "selected_stopwatch", None) is None:
+            return
+        self.selected_stopwatch.toggle_class("marked")
+        self.mark_anchor = self.selected_stopwatch
+
+    def action_mark_range(self) -> None:
+        """Mark every stopwatch between the last toggled mark and the selected stopwatch."""
+        if getattr(self, "selected_stopwatch", None) is None:
+            return
+        timers = self.stopwatches()
+        anchor = getattr(self, "mark_anchor", None)
+        if anchor not in timers:
+            anchor = self.selected_stopwatch
+        start, end = sorted((timers.index(anchor), timers.index(self.selected_stopwatch)))
+        with self.batch_update():
+            for sw in timers[start : end + 1]:
+                sw.add_class("marked", update=False)
+            self.restyle_stopwatches(timers[start : end + 1], children=False)
+        self.mark_anchor = self.selected_stopwatch
+        logger.debug("Marked %s stopwatches by range.", end - start + 1)
+
+    @work
+    async def action_mark_search(self) -> None:
+        """Mark every stopwatch whose name or group contains the search text."""
+        query = await self.push_screen_wait(InputScreen(placeholder="Mark stopwatches matching..."))
+        if query is None or not query.strip():
+            return
+        query = query.strip().casefold()
+        matches = [
+            sw
+            for sw in self.stopwatches()
+            if query in sw.sw_name.casefold() or (sw.group and query in sw.group.casefold())
+        ]
+        with self.batch_update():
+            for sw in matches:
+                sw.add_class("marked", update=False)
+            self.restyle_stopwatches(matches, children=False)
+        self.notify(f"Marked {len(matches)} stopwatches")
+        logger.info("Marked %s stopwatches matching: %s", len(matches), query)
+
+    def action_clear_marks(self) -> None:
+        marked = self.stopwatches("marked")
+        with self.batch_update():
+            for sw in marked:
+                sw.remove_class("marked", update=False)
+            self.restyle_stopwatches(marked, children=False)
+        self.mark_anchor = None
+
+    @work
+    async def action_move_to_group(self) -> None:
+        """Assign the target stopwatches to a group and move them next to its other members."""
+        targets = self.target_stopwatches()
+        if not targets:
+            return
+        groups = {sw.group for sw in targets}
+        current = groups.pop() if len(groups) == 1 else None
+        group = await self.push_screen_wait(
+            InputScreen(value=current or "", placeholder="Enter group name (empty to ungroup)")
+        )
+        if group is None:
+            return
+        group = group.strip() or None
+
+        # Gather the targets after the last existing member of the group, or after the first target for a new group
+        targets_set = set(targets)
+        anchor = None
+        to_move = targets
+        if group:
+            for sw in self.stopwatches():
+                if sw.group == group and sw not in targets_set:
+                    anchor = sw
+            if anchor is None:
+                anchor, to_move = targets[0], targets[1:]
+        container = self.query_one("#timers")
+        with self.batch_update():
+            for sw in targets:
+                sw.set_group(group)
+            if anchor is not None:
+                # Insert in reverse, each right after the anchor, to keep the original relative order
+                for sw in reversed(to_move):
+                    container.move_child(sw, after=anchor)
+        if anchor is not None:
+            self.call_after_refresh(self.restyle_visible_stopwatches)
+        logger.info("%s stopwatches moved to group: %s", len(targets), group)
+        self.save_after_bulk(targets)
 
     def action_select_up(self) -> None:
         timers = list(self.query("Stopwatch"))
@@ -308,14 +488,14 @@ class StopwatchApp(App):
         self.query_one("#timers").mount(new_stopwatch)
         self.select_stopwatch(new_stopwatch)
         new_stopwatch.scroll_visible()
-        logger.info(f"Stopwatch added: {new_name}")
+        logger.info("Stopwatch added: %s", new_name)
 
     @work
     async def action_delete_stopwatch(self) -> None:
-        timers = self.query("Stopwatch")
+        timers = self.stopwatches()
         if not timers:
             return
-        to_remove = self.selected_stopwatch if hasattr(self, "selected_stopwatch") else None
+        to_remove = self.target_stopwatches()
         if not to_remove:
             logger.warning("No stopwatch selected for deletion.")
             return
@@ -324,36 +504,45 @@ class StopwatchApp(App):
         if self.config.get("confirmation_screens", True):
             confirmed = await self.push_screen_wait(
                 ConfirmScreen(
-                    stopwatch_name=getattr(to_remove, "sw_name", "Stopwatch"), action_name="delete", confirm_key="d"
+                    stopwatch_name=getattr(to_remove[0], "sw_name", "Stopwatch"),
+                    action_name="delete",
+                    confirm_key="d",
+                    count=len(to_remove),
                 )
             )
             if not confirmed:
                 logger.info("Delete cancelled by user.")
                 return
 
-        next_selected = None
-        for sw in timers:
-            if sw is to_remove:
-                break
-            next_selected = sw
-        if not next_selected:
-            idx = list(timers).index(to_remove)
-            if idx + 1 < len(timers):
-                next_selected = list(timers)[idx + 1]
-
-        to_remove.remove()
-        logger.info(f"Stopwatch deleted: {to_remove.sw_name}")
+        # Keep the selection if it survives, otherwise move to the closest remaining stopwatch (preferring above)
+        removed = set(to_remove)
+        next_selected = self.selected_stopwatch if self.selected_stopwatch not in removed else None
+        if not next_selected and self.selected_stopwatch in timers:
+            idx = timers.index(self.selected_stopwatch)
+            before = [sw for sw in timers[:idx] if sw not in removed]
+            after = [sw for sw in timers[idx + 1 :] if sw not in removed]
+            next_selected = before[-1] if before else (after[0] if after else None)
+
+        await self.query_one("#timers").remove_children(to_remove)
+        self.stale_stopwatches.difference_update(to_remove)
+        # Stopwatches below the removed ones move up, possibly into view
+        self.call_after_refresh(self.restyle_visible_stopwatches)
+        if len(to_remove) == 1:
+            logger.info("Stopwatch deleted: %s", to_remove[0].sw_name)
+        else:
+            logger.info("%s stopwatches deleted.", len(to_remove))
         if next_selected:
             self.select_stopwatch(next_selected)
         else:
             self.selected_stopwatch = None
+        self.save_after_bulk(to_remove)
 
     def select_stopwatch(self, stopwatch):
-        for sw in self.query("Stopwatch"):
+        for sw in self.stopwatches("selected"):
             sw.remove_class("selected")
         stopwatch.add_class("selected")
         self.selected_stopwatch = stopwatch
-        logger.debug(f"Stopwatch selected: {stopwatch.sw_name}")
+        logger.debug("Stopwatch selected: %s", stopwatch.sw_name)
 
     def action_configure_theme(self) -> None:
         self.search_themes()
@@ -370,12 +559,12 @@ class StopwatchApp(App):
 
     def action_stop_all_stopwatches(self) -> None:
         """Stop all running stopwatches."""
-        for sw in self.query("Stopwatch"):
-            if "started" in sw.classes:
-                time_display = sw.query_one("TimeDisplay")
-                time_display.stop()
-                sw.remove_class("started")
-                logger.info(f"Stopped stopwatch: {sw.sw_name}")
+        running = self.stopwatches("started")
+        with self.batch_update():
+            for sw in running:
+                sw.stop_timer(update=False)
+                logger.debug("Stopped stopwatch: %s", sw.sw_name)
+            self.restyle_stopwatches(running)
         logger.info("All stopwatches stopped.")
 
     def action_configure_settings(self) -> None:
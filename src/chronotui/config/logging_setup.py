@@ -0,0 +1,185 @@
+import copy
+import datetime
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from time import monotonic
+from typing import Callable, Optional
+
+LOG_FILE = "chronotui.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Hot path messages (same logger and message template) allowed per interval before they get dropped
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_INTERVAL = 1.0
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop repeated records of the same message template once they exceed the rate limit.
+
+    For every template with dropped records, a summary record with the count is passed to `report`
+    with the next logged record after its window expires, or on `flush()`. Warnings and errors are never
+    dropped, and neither is any record if the filter itself fails.
+    """
+
+    def __init__(
+        self,
+        report: Callable[[logging.LogRecord], None],
+        burst: int = RATE_LIMIT_BURST,
+        interval: float = RATE_LIMIT_INTERVAL,
+    ):
+        super().__init__()
+        self.report = report
+        self.burst = burst
+        self.interval = interval
+        # (logger name, message template) -> [window start, records in window, suppressed]
+        self._windows: dict[tuple[str, str], list] = {}
+        self._last_sweep = monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # A log call must never raise, so any failure here lets the record through
+        try:
+            return self._filter(record)
+        except Exception:
+            return True
+
+    def _filter(self, record: logging.LogRecord) -> bool:
+        now = monotonic()
+        expired = []
+        with self._lock:
+            if now - self._last_sweep >= self.interval:
+                expired = self._sweep(now)
+            if record.levelno >= logging.WARNING:
+                allowed = True
+            else:
+                # `msg` can be any object, not necessarily hashable
+                template = record.msg if isinstance(record.msg, str) else str(record.msg)
+                key = (record.name, template)
+                window = self._windows.get(key)
+                if window is None or now - window[0] >= self.interval:
+                    if window is not None and window[2]:
+                        expired.append((key, window[2]))
+                    self._windows[key] = [now, 1, 0]
+                    allowed = True
+                elif window[1] < self.burst:
+                    window[1] += 1
+                    allowed = True
+                else:
+                    window[2] += 1
+                    allowed = False
+        self._report(expired)
+        return allowed
+
+    def flush(self) -> None:
+        """Report all pending suppressed counts, expired or not."""
+        with self._lock:
+            expired = self._sweep(None)
+        self._report(expired)
+
+    def _sweep(self, now: Optional[float]) -> list:
+        """Forget expired windows (all of them if `now` is None), returning those with suppressed records."""
+        self._last_sweep = monotonic() if now is None else now
+        expired = []
+        for key, window in list(self._windows.items()):
+            if now is None or now - window[0] >= self.interval:
+                del self._windows[key]
+                if window[2]:
+                    expired.append((key, window[2]))
+        return expired
+
+    def _report(self, expired: list) -> None:
+        for (name, template), suppressed in expired:
+            summary = logging.LogRecord(
+                name, logging.INFO, "", 0, "Suppressed %d records of: %s", (suppressed, template), None
+            )
+            summary.suppressed = suppressed
+            self.report(summary)
+
+
+class SnapshotQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler which snapshots the message at log time and leaves the JSON encoding to the listener.
+
+    The %-interpolation of the message with its arguments happens here, on the logging thread, for every
+    record that passes the level check and the filters. That way the message reflects the arguments at
+    the time of logging, even if they are mutated later, and the listener thread never reads live objects.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class RotatingJsonFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler which encodes every record only once.
+
+    Both `shouldRollover()`, to measure the line, and `emit()` format the record.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = getattr(record, "_json_line", None)
+        if line is None:
+            line = record._json_line = super().format(record)
+        return line
+
+
+def setup_logging(file_logging: bool) -> Optional[Callable[[], None]]:
+    """Configure logging for the app.
+
+    With file logging, records go through a queue to a background thread, which writes them as JSON
+    lines to a size-rotated log file. Returns a function to call on exit, which reports pending
+    suppressed counts and flushes the queue. Without file logging, errors go to stderr and None is returned.
+    """
+    if not file_logging:
+        logging.basicConfig(level=logging.ERROR)
+        return None
+
+    file_handler = RotatingJsonFileHandler(
+        LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = SnapshotQueueHandler(log_queue)
+    # Summaries go straight to `emit`, bypassing the filter, so they are never rate limited themselves
+    rate_limit = RateLimitFilter(report=queue_handler.emit)
+    queue_handler.addFilter(rate_limit)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+
+    def stop_logging() -> None:
+        rate_limit.flush()
+        listener.stop()
+        root.removeHandler(queue_handler)
+
+    return stop_logging
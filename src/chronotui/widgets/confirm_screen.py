@@ -33,15 +33,20 @@ class ConfirmScreen(ModalScreen[bool]):
     }
     """
 
-    def __init__(self, stopwatch_name: str, action_name: str, confirm_key: str):
+    def __init__(self, stopwatch_name: str, action_name: str, confirm_key: str, count: int = 1):
         super().__init__()
         self.stopwatch_name = stopwatch_name
         self.action_name = action_name
         self.confirm_key = confirm_key
+        self.count = count
 
     def compose(self) -> ComposeResult:
+        if self.count > 1:
+            question = f"{self.action_name.capitalize()} {self.count} stopwatches?"
+        else:
+            question = f"{self.action_name.capitalize()} stopwatch '{self.stopwatch_name}'?"
         yield Grid(
-            Label(f"{self.action_name.capitalize()} stopwatch '{self.stopwatch_name}'?", id="question"),
+            Label(question, id="question", markup=False),
             Button(self.action_name.capitalize(), variant="error", id="confirm-btn"),
             Button("Cancel", variant="primary", id="cancel-btn"),
             id="dialog",
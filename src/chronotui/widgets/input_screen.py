@@ -0,0 +1,24 @@
+from textual.app import ComposeResult
+from textual.containers import Center
+from textual.screen import ModalScreen
+from textual.widgets import Input
+
+
+class InputScreen(ModalScreen[str]):
+    """Single line text prompt. Dismisses with the entered text, or None on escape."""
+
+    def __init__(self, value: str = "", placeholder: str = ""):
+        super().__init__()
+        self.value = value
+        self.placeholder = placeholder
+
+    def compose(self) -> ComposeResult:
+        yield Center(Input(value=self.value, placeholder=self.placeholder, id="text-input"))
+
+    def on_key(self, event) -> None:
+        if event.key == "escape":
+            event.stop()
+            self.dismiss(None)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        self.dismiss(self.query_one(Input).value)
@@ -5,6 +5,8 @@ from textual.containers import Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Checkbox, Label
 
+logger = logging.getLogger(__name__)
+
 
 class SettingsScreen(ModalScreen):
     CSS = """
@@ -78,4 +80,4 @@ class SettingsScreen(ModalScreen):
             key = event.checkbox.id.removeprefix("setting-")
             self.app.config[key] = event.value
             self.app.save_config()
-            logging.info(f"Settings updated: {key} = {event.value}")
+            logger.info("Settings updated: %s = %s", key, event.value)
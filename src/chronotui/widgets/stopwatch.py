@@ -18,22 +18,26 @@ class Stopwatch(HorizontalGroup):
         time: float = 0.0,
         running: bool = False,
         active: bool = False,
+        group: Optional[str] = None,
     ) -> None:
         super().__init__()
         self.sw_name = name or "Stopwatch"
+        self.group = group or None
         self._label_widget = None
+        self._time_display = None
         self._init_time = time
         self._init_running = running
         self._init_active = active
 
     def compose(self):
-        label = Label(self.sw_name, id="sw-name")
+        label = Label(self.display_name, id="sw-name", markup=False)
         self._label_widget = label
         yield label
         yield Button("Start", id="start", variant="success")
         yield Button("Stop", id="stop", variant="error")
         yield Button("Reset", id="reset")
         td = TimeDisplay()
+        self._time_display = td
         yield td
 
         # Set initial state after mounting
@@ -46,32 +50,64 @@ class Stopwatch(HorizontalGroup):
                 if self._init_active:
                     self.add_class("selected")
             except Exception as e:
-                logger.warning(f"Failed to set initial state for stopwatch {self.sw_name}: {e}")
+                logger.warning("Failed to set initial state for stopwatch %s: %s", self.sw_name, e)
 
         self.call_after_refresh(_post_mount)
 
+    @property
+    def display_name(self) -> str:
+        """Name shown in the label, prefixed with the group if there is one."""
+        return f"{self.group}: {self.sw_name}" if self.group else self.sw_name
+
+    @property
+    def time_display(self) -> TimeDisplay:
+        """The TimeDisplay child, cached to avoid a DOM query on every access."""
+        if self._time_display is None:
+            self._time_display = self.query_one(TimeDisplay)
+        return self._time_display
+
+    @property
+    def running(self) -> bool:
+        return self.has_class("started")
+
     def set_name(self, new_name: str) -> None:
         self.sw_name = new_name
         if self._label_widget is not None:
-            self._label_widget.update(new_name)
-        logger.info(f"Stopwatch renamed to: {new_name}")
+            self._label_widget.update(self.display_name)
+        logger.info("Stopwatch renamed to: %s", new_name)
+
+    def set_group(self, group: Optional[str]) -> None:
+        self.group = group or None
+        if self._label_widget is not None:
+            self._label_widget.update(self.display_name)
+
+    # `update=False` leaves restyling to the caller, so bulk operations can restyle all stopwatches in one pass
+
+    def start_timer(self, update: bool = True) -> None:
+        self.time_display.start()
+        self.add_class("started", update=update)
+
+    def stop_timer(self, update: bool = True) -> None:
+        self.time_display.stop()
+        self.remove_class("started", update=update)
+
+    def reset_timer(self, update: bool = True) -> None:
+        self.time_display.reset()
+        self.remove_class("started", update=update)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         app = self.app
         button_id = event.button.id
-        time_display = self.query_one(TimeDisplay)
         if hasattr(app, "selected_stopwatch") and app.selected_stopwatch is not self:
             app.select_stopwatch(self)
         if button_id == "start":
             if app.config.get("stop_all_on_start", False):
                 app.action_stop_all_stopwatches()
-            time_display.start()
-            self.add_class("started")
-            logger.debug(f"Start pressed for {self.sw_name}")
+            self.start_timer()
+            logger.debug("Start pressed for %s", self.sw_name)
         elif button_id == "stop":
-            time_display.stop()
-            self.remove_class("started")
-            logger.debug(f"Stop pressed for {self.sw_name}")
+            self.stop_timer()
+            logger.debug("Stop pressed for %s", self.sw_name)
         elif button_id == "reset":
-            time_display.reset()
-            logger.debug(f"Reset pressed for {self.sw_name}")
+            self.time_display.reset()
+            logger.debug("Reset pressed for %s", self.sw_name)
@@ -1,7 +1,7 @@
 import logging
 from time import monotonic
 
-from textual.reactive import reactive
+from textual.reactive import reactive, var
 from textual.widgets import Digits
 
 logger = logging.getLogger(__name__)
@@ -10,9 +10,10 @@ logger = logging.getLogger(__name__)
 class TimeDisplay(Digits):
     """A widget to display elapsed time."""
 
-    start_time = reactive(monotonic)
+    # Only `time` is displayed, the other two don't need to trigger a refresh
+    start_time = var(monotonic)
     time = reactive(0.0)
-    total = reactive(0.0)
+    total = var(0.0)
 
     def on_mount(self) -> None:
         self.update_timer = self.set_interval(1 / 60, self.update_time, pause=True)